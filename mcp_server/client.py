@@ -1,132 +1,214 @@
+import asyncio
 import socket
 import sys
-import threading
-import time
 from typing import Optional
 
 class MCPClient:
-    def __init__(self, host: str = 'localhost', port: int = 5001):
+    def __init__(self, host: str = 'localhost', port: int = 5001, nodelay: bool = True,
+                 busy_poll: int = 50):
         """Initialize the MCP client with server details."""
         self.host = host
         self.port = port
-        self.socket = None
+        self.nodelay = nodelay
+        self.busy_poll = busy_poll
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
         self.running = False
-        self.receive_thread: Optional[threading.Thread] = None
 
-    def connect(self) -> bool:
+    async def connect(self) -> bool:
         """Connect to the MCP server."""
         try:
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket.connect((self.host, self.port))
+            # Line framing is done in _receive_messages, which also enforces
+            # the 64 KiB cap on a single response line.
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+            sock = self.writer.get_extra_info('socket')
+            if sock is not None:
+                self._configure_socket(sock)
             self.running = True
-            
-            # Start receive thread
-            self.receive_thread = threading.Thread(target=self._receive_messages)
-            self.receive_thread.daemon = True
-            self.receive_thread.start()
-            
+
             print(f"Connected to MCP Server at {self.host}:{self.port}")
             print("Type 'HELP' for available commands or 'EXIT' to quit.")
             return True
-            
+
         except Exception as e:
             print(f"Failed to connect to server: {e}")
             return False
 
-    def _receive_messages(self) -> None:
-        """Background thread to receive messages from the server."""
-        buffer = ""
+    def _configure_socket(self, sock: socket.socket) -> None:
+        """Apply socket options to the connected socket."""
+        if self.nodelay:
+            # Disable Nagle's algorithm so small commands go out immediately.
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        try:
+            # Cap unsent bytes queued in the kernel send buffer (16 KiB).
+            sock.setsockopt(
+                socket.IPPROTO_TCP,
+                getattr(socket, 'TCP_NOTSENT_LOWAT', 25),
+                16384
+            )
+        except OSError:
+            pass  # Not supported on this platform
+        if self.busy_poll > 0:
+            try:
+                # Busy-poll the NIC for this many microseconds during
+                # reads instead of waiting for the wake-up interrupt.
+                sock.setsockopt(
+                    socket.SOL_SOCKET,
+                    getattr(socket, 'SO_BUSY_POLL', 46),
+                    self.busy_poll
+                )
+            except OSError:
+                pass  # Linux-only, may need CAP_NET_ADMIN
+
+    async def _receive_messages(self) -> None:
+        """Background task to receive messages from the server."""
+        buffer = bytearray()
         while self.running:
             try:
-                data = self.socket.recv(1024)
-                if not data:
-                    print("\nDisconnected from server.")
-                    self.running = False
-                    break
-                    
-                # Handle potential partial messages
-                buffer += data.decode('utf-8')
-                while '\n' in buffer:
-                    line, buffer = buffer.split('\n', 1)
-                    print(f"\r{line}\n> ", end='', flush=True)
-                    
+                data = await self.reader.read(65536)
             except ConnectionResetError:
                 print("\nConnection to server was reset.")
                 self.running = False
                 break
+            except asyncio.CancelledError:
+                break
             except Exception as e:
-                print(f"\nError receiving message: {e}")
+                if self.running:
+                    print(f"\nError receiving message: {e}")
+                self.running = False
+                break
+
+            if not data:
+                print("\nDisconnected from server.")
+                self.running = False
+                break
+
+            # Drain every complete line from this chunk and print them with
+            # a single write/flush, so a burst of messages costs one
+            # write() syscall instead of one per line.
+            buffer.extend(data)
+            lines = []
+            idx = buffer.find(b'\n')
+            while idx >= 0:
+                lines.append(buffer[:idx].decode('utf-8').rstrip())
+                del buffer[:idx + 1]
+                idx = buffer.find(b'\n')
+            if lines:
+                sys.stdout.write('\r' + '\n'.join(lines) + '\n> ')
+                sys.stdout.flush()
+
+            # Mirror the server's 64 KiB line limit: a stream that never
+            # sends a newline must not grow the buffer without bound.
+            if len(buffer) > 65536:
+                print("\nError receiving message: response line exceeds 64 KiB")
                 self.running = False
                 break
 
-    def send_command(self, command: str) -> None:
+    async def send_command(self, command: str) -> None:
         """Send a command to the server."""
         if not command.strip():
             return
-            
+
         try:
-            self.socket.sendall(f"{command}\n".encode('utf-8'))
+            self.writer.write(f"{command}\n".encode('utf-8'))
+            await self.writer.drain()
         except Exception as e:
             print(f"Failed to send command: {e}")
             self.running = False
 
-    def disconnect(self) -> None:
+    async def disconnect(self) -> None:
         """Disconnect from the server and clean up."""
         self.running = False
-        if self.socket:
+        if self.writer:
             try:
-                self.socket.close()
-            except:
+                self.writer.close()
+                await self.writer.wait_closed()
+            except Exception:
                 pass
-            self.socket = None
+            self.writer = None
+            self.reader = None
 
-def main():
-    """Main function to run the MCP client."""
-    import argparse
-    
-    # Parse command line arguments
-    parser = argparse.ArgumentParser(description='MCP Client')
-    parser.add_argument('--host', default='localhost', help='Server hostname or IP')
-    parser.add_argument('--port', type=int, default=5001, help='Server port (default: 5001)')
-    args = parser.parse_args()
-    
-    # Create and connect client
-    client = MCPClient(host=args.host, port=args.port)
-    print(f"Connecting to MCP Server at {args.host}:{args.port}...")
-    
-    if not client.connect():
-        print(f"Failed to connect to server at {args.host}:{args.port}")
+async def run_client(host: str, port: int) -> int:
+    """Connect a client and run the interactive command loop."""
+    client = MCPClient(host=host, port=port)
+    print(f"Connecting to MCP Server at {host}:{port}...")
+
+    if not await client.connect():
+        print(f"Failed to connect to server at {host}:{port}")
         print("Please make sure the server is running and the port is correct.")
         return 1
-    
+
+    receive_task = asyncio.create_task(client._receive_messages())
+    loop = asyncio.get_running_loop()
+
+    # Poll stdin from the event loop itself instead of parking a thread on
+    # input(); falls back to the executor where add_reader doesn't support
+    # regular file descriptors (e.g. the Windows proactor loop).
+    stdin_queue: asyncio.Queue = asyncio.Queue()
+    try:
+        loop.add_reader(sys.stdin.fileno(), lambda: stdin_queue.put_nowait(sys.stdin.readline()))
+        stdin_polled = True
+    except (NotImplementedError, PermissionError, OSError):
+        stdin_polled = False
+
     try:
         # Main command loop
         while client.running:
             try:
-                # Get user input (with prompt)
-                command = input("> ").strip()
-                
+                sys.stdout.write("> ")
+                sys.stdout.flush()
+                if stdin_polled:
+                    line = await stdin_queue.get()
+                else:
+                    line = await loop.run_in_executor(None, sys.stdin.readline)
+
+                if line == '':  # EOF (Ctrl-D)
+                    print("\nDisconnecting...")
+                    await client.send_command('EXIT')
+                    break
+
+                command = line.strip()
+
                 # Handle exit command
                 if command.upper() == 'EXIT':
-                    client.send_command('EXIT')
-                    time.sleep(0.5)  # Give time for the server to respond
+                    await client.send_command('EXIT')
+                    await asyncio.sleep(0.5)  # Give time for the server to respond
                     break
-                    
+
                 # Send command to server
-                client.send_command(command)
-                
-            except (EOFError, KeyboardInterrupt):
+                await client.send_command(command)
+
+            except KeyboardInterrupt:
                 print("\nDisconnecting...")
-                client.send_command('EXIT')
+                await client.send_command('EXIT')
                 break
             except Exception as e:
                 print(f"\nError: {e}")
                 break
-                
+
     finally:
-        client.disconnect()
-    
+        if stdin_polled:
+            loop.remove_reader(sys.stdin.fileno())
+        receive_task.cancel()
+        await client.disconnect()
+
     return 0
 
+def main():
+    """Main function to run the MCP client."""
+    import argparse
+
+    # Parse command line arguments
+    parser = argparse.ArgumentParser(description='MCP Client')
+    parser.add_argument('--host', default='localhost', help='Server hostname or IP')
+    parser.add_argument('--port', type=int, default=5001, help='Server port (default: 5001)')
+    args = parser.parse_args()
+
+    try:
+        return asyncio.run(run_client(args.host, args.port))
+    except KeyboardInterrupt:
+        print("\nDisconnecting...")
+        return 0
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -1,5 +1,8 @@
+import asyncio
+import errno
+import multiprocessing
+import os
 import socket
-import threading
 import logging
 from typing import Dict, Tuple
 
@@ -14,12 +17,16 @@ logging.basicConfig(
 )
 
 class MCPServer:
-    def __init__(self, host: str = '0.0.0.0', port: int = 5001):
+    def __init__(self, host: str = '0.0.0.0', port: int = 5001, nodelay: bool = True,
+                 busy_poll: int = 50, max_clients: int = 64):
         """Initialize the MCP server with host and port."""
         self.host = host
         self.port = port
-        self.server_socket = None
-        self.clients: Dict[tuple, socket.socket] = {}
+        self.nodelay = nodelay
+        self.busy_poll = busy_poll
+        self.max_clients = max_clients
+        self.server: asyncio.Server = None
+        self.clients: Dict[Tuple[str, int], asyncio.StreamWriter] = {}
         self.running = False
         self.command_handlers = {
             'HELLO': self._handle_hello,
@@ -27,90 +34,157 @@ class MCPServer:
             'EXIT': self._handle_exit,
             'HELP': self._handle_help
         }
+        # Dispatch table precomputed with the common spellings of each
+        # command, keyed by raw bytes so the hot path needs neither a
+        # decode nor an upper() allocation; other casings fall back to an
+        # uppercased lookup.
+        self._dispatch = {}
+        for name, handler in self.command_handlers.items():
+            for spelling in (name, name.lower(), name.capitalize()):
+                self._dispatch[spelling.encode('ascii')] = handler
+        # Captured once so the hot loop can detect EXIT by identity;
+        # self._handle_exit would build a fresh bound method per access.
+        self._exit_handler = self.command_handlers['EXIT']
 
-    def start(self) -> None:
+    async def start(self) -> None:
         """Start the MCP server and begin accepting connections."""
+        # 64 KiB stream limit bounds the longest accepted command line;
+        # SO_RCVBUF is left alone so kernel autotuning stays active.
+        # reuse_port lets several worker processes bind the same port and
+        # have the kernel load-balance accepted connections between them.
+        self.server = await asyncio.start_server(
+            self._handle_client, self.host, self.port, limit=65536,
+            reuse_port=hasattr(socket, 'SO_REUSEPORT')
+        )
+        self.running = True
+
+        logging.info(f"MCP Server started on {self.host}:{self.port}")
+        logging.info("Waiting for connections...")
+
         try:
-            self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            self.server_socket.bind((self.host, self.port))
-            self.server_socket.listen(5)
-            self.running = True
-            
-            logging.info(f"MCP Server started on {self.host}:{self.port}")
-            logging.info("Waiting for connections...")
-            
-            while self.running:
-                try:
-                    client_socket, client_address = self.server_socket.accept()
-                    client_thread = threading.Thread(
-                        target=self._handle_client,
-                        args=(client_socket, client_address)
-                    )
-                    client_thread.daemon = True
-                    client_thread.start()
-                    logging.info(f"New connection from {client_address}")
-                except OSError as e:
-                    if self.running:
-                        logging.error(f"Error accepting connection: {e}")
+            async with self.server:
+                await self.server.serve_forever()
+        except asyncio.CancelledError:
+            pass
         except Exception as e:
             logging.error(f"Server error: {e}")
         finally:
-            self.stop()
+            await self.stop()
 
-    def stop(self) -> None:
+    async def stop(self) -> None:
         """Stop the MCP server and close all connections."""
         self.running = False
-        if self.server_socket:
+        if self.server:
             try:
-                self.server_socket.close()
+                self.server.close()
+                await self.server.wait_closed()
             except Exception as e:
                 logging.error(f"Error closing server socket: {e}")
-        
+
         # Close all client connections
-        for client_socket in self.clients.values():
+        for writer in self.clients.values():
             try:
-                client_socket.close()
+                writer.close()
             except Exception as e:
                 logging.error(f"Error closing client socket: {e}")
-        
+
         self.clients.clear()
         logging.info("MCP Server stopped")
 
-    def _handle_client(self, client_socket: socket.socket, client_address: Tuple[str, int]) -> None:
+    def _configure_socket(self, client_socket: socket.socket) -> None:
+        """Apply per-connection socket options to an accepted socket."""
+        if self.nodelay:
+            # Disable Nagle's algorithm: responses are small
+            # newline-framed messages, so coalescing only adds latency.
+            client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        try:
+            # Cap unsent bytes queued in the kernel (16 KiB) so slow
+            # readers can't build up megabytes of send-buffer backlog.
+            client_socket.setsockopt(
+                socket.IPPROTO_TCP,
+                getattr(socket, 'TCP_NOTSENT_LOWAT', 25),
+                16384
+            )
+        except OSError:
+            pass  # Not supported on this platform
+        if self.busy_poll > 0:
+            try:
+                # Busy-poll the NIC for this many microseconds during reads
+                # instead of sleeping until the interrupt wakes us up.
+                client_socket.setsockopt(
+                    socket.SOL_SOCKET,
+                    getattr(socket, 'SO_BUSY_POLL', 46),
+                    self.busy_poll
+                )
+            except OSError:
+                pass  # Linux-only, may need CAP_NET_ADMIN
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
         """Handle communication with a connected client."""
-        self.clients[client_address] = client_socket
-        
+        client_address = writer.get_extra_info('peername')
+
+        # Bound concurrency: refuse connections beyond max_clients so a
+        # connection storm degrades predictably instead of exhausting memory.
+        if len(self.clients) >= self.max_clients:
+            logging.warning(f"Rejecting {client_address}: {self.max_clients} clients connected")
+            await self._send_response(writer, "ERROR: Server busy, try again later.")
+            writer.close()
+            return
+
+        client_socket = writer.get_extra_info('socket')
+        if client_socket is not None:
+            self._configure_socket(client_socket)
+
+        self.clients[client_address] = writer
+        logging.info(f"New connection from {client_address}")
+
         try:
             # Send welcome message
-            self._send_response(client_socket, "MCP Server: Connected. Type 'HELP' for available commands.")
-            
+            await self._send_response(writer, "MCP Server: Connected. Type 'HELP' for available commands.")
+
             while self.running:
                 try:
-                    # Receive data from client
-                    data = client_socket.recv(1024).decode('utf-8').strip()
-                    if not data:
-                        break
-                        
-                    logging.info(f"Received from {client_address}: {data}")
-                    
+                    # Receive one newline-framed command from the client.
+                    # The frame stays bytes until a handler needs text: the
+                    # command word dispatches on raw bytes and only the
+                    # argument tail is decoded, avoiding a full-line
+                    # decode/strip/split allocation chain per message.
+                    line = (await reader.readuntil(b'\n')).strip()
+                    if not line:
+                        continue
+
+                    logging.info(f"Received from {client_address}: {line.decode('utf-8', 'replace')}")
+
                     # Process command
-                    parts = data.split(' ', 1)
-                    command = parts[0].upper()
-                    arg = parts[1] if len(parts) > 1 else ''
-                    
-                    if command in self.command_handlers:
-                        self.command_handlers[command](client_socket, arg)
+                    space = line.find(b' ')
+                    if space >= 0:
+                        command, arg_bytes = line[:space], line[space + 1:]
+                    else:
+                        command, arg_bytes = line, b''
+
+                    handler = self._dispatch.get(command)
+                    if handler is None:
+                        handler = self._dispatch.get(command.upper())
+                    if handler is not None:
+                        await handler(writer, arg_bytes.decode('utf-8'))
+                        if handler is self._exit_handler:
+                            break
                     else:
-                        self._send_response(client_socket, f"ERROR: Unknown command: {command}")
-                        
-                except ConnectionResetError:
+                        await self._send_response(
+                            writer,
+                            f"ERROR: Unknown command: {command.decode('utf-8', 'replace').upper()}"
+                        )
+
+                except (asyncio.IncompleteReadError, ConnectionResetError):
+                    break
+                except asyncio.LimitOverrunError:
+                    await self._send_response(writer, "ERROR: Command too long")
                     break
                 except Exception as e:
                     logging.error(f"Error handling client {client_address}: {e}")
-                    self._send_response(client_socket, f"ERROR: {str(e)}")
+                    await self._send_response(writer, f"ERROR: {str(e)}")
                     break
-                    
+
         except Exception as e:
             logging.error(f"Error in client handler for {client_address}: {e}")
         finally:
@@ -118,38 +192,38 @@ class MCPServer:
             if client_address in self.clients:
                 del self.clients[client_address]
             try:
-                client_socket.close()
-            except:
+                writer.close()
+                await writer.wait_closed()
+            except Exception:
                 pass
             logging.info(f"Client disconnected: {client_address}")
 
-    def _send_response(self, client_socket: socket.socket, message: str) -> None:
+    async def _send_response(self, writer: asyncio.StreamWriter, message: str) -> None:
         """Send a response to a client."""
         try:
-            client_socket.sendall(f"{message}\n".encode('utf-8'))
+            writer.write(f"{message}\n".encode('utf-8'))
+            await writer.drain()
         except Exception as e:
             logging.error(f"Error sending response: {e}")
 
     # Command Handlers
-    def _handle_hello(self, client_socket: socket.socket, arg: str) -> None:
+    async def _handle_hello(self, writer: asyncio.StreamWriter, arg: str) -> None:
         """Handle HELLO command."""
         name = arg if arg else 'Guest'
-        self._send_response(client_socket, f"Hello, {name}! Welcome to MCP Server.")
+        await self._send_response(writer, f"Hello, {name}! Welcome to MCP Server.")
 
-    def _handle_echo(self, client_socket: socket.socket, arg: str) -> None:
+    async def _handle_echo(self, writer: asyncio.StreamWriter, arg: str) -> None:
         """Handle ECHO command."""
         if not arg:
-            self._send_response(client_socket, "ECHO: You didn't provide any text to echo.")
+            await self._send_response(writer, "ECHO: You didn't provide any text to echo.")
         else:
-            self._send_response(client_socket, f"ECHO: {arg}")
+            await self._send_response(writer, f"ECHO: {arg}")
 
-    def _handle_exit(self, client_socket: socket.socket, arg: str) -> None:
+    async def _handle_exit(self, writer: asyncio.StreamWriter, arg: str) -> None:
         """Handle EXIT command."""
-        self._send_response(client_socket, "Goodbye!")
-        if client_socket in self.clients.values():
-            client_socket.close()
+        await self._send_response(writer, "Goodbye!")
 
-    def _handle_help(self, client_socket: socket.socket, arg: str) -> None:
+    async def _handle_help(self, writer: asyncio.StreamWriter, arg: str) -> None:
         """Handle HELP command."""
         help_text = """
 Available Commands:
@@ -158,44 +232,56 @@ Available Commands:
   EXIT          - Disconnect from the server
   HELP          - Show this help message
 """
-        self._send_response(client_socket, help_text.strip())
+        await self._send_response(writer, help_text.strip())
+
+
+def serve(host: str, port: int) -> None:
+    """Run one MCPServer event loop in the current process."""
+    server = MCPServer(host=host, port=port)
+    try:
+        asyncio.run(server.start())
+    except KeyboardInterrupt:
+        logging.info("\nShutting down server...")
 
 
 def main():
     """Main function to start the MCP server."""
-    import socket
-    
     # Try default port, if busy, try next available port
     port = 5001
     max_attempts = 5
-    server = None
-    
+
+    # One event loop per core: with SO_REUSEPORT each worker process binds
+    # the same port and the kernel spreads incoming connections across
+    # them, so parsing/handling scales past a single GIL.
+    workers = (os.cpu_count() or 1) if hasattr(socket, 'SO_REUSEPORT') else 1
+
     for attempt in range(max_attempts):
+        print(f"Starting MCP Server on port {port} with {workers} worker(s)...")
+        extra_workers = []
         try:
-            server = MCPServer(host='0.0.0.0', port=port)
-            print(f"Starting MCP Server on port {port}...")
-            server.start()
+            for _ in range(workers - 1):
+                proc = multiprocessing.Process(target=serve, args=('0.0.0.0', port), daemon=True)
+                proc.start()
+                extra_workers.append(proc)
+            serve('0.0.0.0', port)
             break
         except OSError as e:
-            if "Address already in use" in str(e) and attempt < max_attempts - 1:
+            if e.errno == errno.EADDRINUSE and attempt < max_attempts - 1:
                 print(f"Port {port} is in use, trying port {port + 1}...")
                 port += 1
             else:
                 logging.error(f"Failed to start server: {e}")
                 return 1
-        except KeyboardInterrupt:
-            logging.info("\nShutting down server...")
-            if server:
-                server.stop()
-            break
         except Exception as e:
             logging.error(f"Fatal error: {e}")
-            if server:
-                server.stop()
             return 1
-    
+        finally:
+            for proc in extra_workers:
+                if proc.is_alive():
+                    proc.terminate()
+
     return 0
 
 
 if __name__ == "__main__":
-    exit(main())
\ No newline at end of file
+    exit(main())